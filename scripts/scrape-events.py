@@ -9,12 +9,30 @@ import re
 import json
 import os
 import random
+import hashlib
+import time
+import argparse
+import signal
+import sys
+import cProfile
+import pstats
+import unicodedata
 from datetime import datetime
+from zoneinfo import ZoneInfo
 from bs4 import BeautifulSoup
 import requests
-from urllib.parse import quote
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from difflib import SequenceMatcher
 
+# Pillow is optional - without it images are still cached locally,
+# but no WebP/AVIF thumbnails are generated
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 # User-Agent to avoid being blocked
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -70,49 +88,662 @@ CATEGORY_KEYWORDS = {
     'outdoor': ['outdoor', 'hiking', 'mountain', 'ski', 'nature', 'adventure', 'trail', 'park', 'sports', 'malet', 'natyra']
 }
 
+# Gazetteer: Kosovo cities with Albanian/English/Serbian spellings
+# 'eventbrite' is the city slug used in Eventbrite discovery URLs
+CITIES = {
+    'prishtina': {'name': 'Prishtina', 'eventbrite': 'pristina',
+                  'aliases': ['prishtina', 'prishtinë', 'prishtine', 'pristina', 'priština', 'prishtinës']},
+    'prizren': {'name': 'Prizren', 'eventbrite': 'prizren',
+                'aliases': ['prizren', 'prizreni', 'prizrenit']},
+    'peja': {'name': 'Peja', 'eventbrite': 'peja',
+             'aliases': ['peja', 'pejë', 'peje', 'pejës', 'peć', 'pec']},
+    'gjakova': {'name': 'Gjakova', 'eventbrite': 'gjakova',
+                'aliases': ['gjakova', 'gjakovë', 'gjakove', 'gjakovës', 'đakovica', 'djakovica']},
+    'gjilan': {'name': 'Gjilan', 'eventbrite': 'gjilan',
+               'aliases': ['gjilan', 'gjilani', 'gjilanit', 'gnjilane']},
+    'ferizaj': {'name': 'Ferizaj', 'eventbrite': 'ferizaj',
+                'aliases': ['ferizaj', 'ferizaji', 'ferizajt', 'uroševac', 'urosevac']},
+    'mitrovica': {'name': 'Mitrovica', 'eventbrite': 'mitrovica',
+                  'aliases': ['mitrovica', 'mitrovicë', 'mitrovice', 'mitrovicës']},
+    'brezovica': {'name': 'Brezovica', 'eventbrite': None,
+                  'aliases': ['brezovica', 'brezovicë', 'brezovice']},
+}
+
+# Known venues, each tied to a city key in CITIES
+VENUES = {
+    'kino-armata': {'name': 'Kino Armata', 'city': 'prishtina',
+                    'aliases': ['kino armata']},
+    'zone-club': {'name': 'ZONE Club', 'city': 'prishtina',
+                  'aliases': ['zone club', 'klubi zone']},
+    'oda-theatre': {'name': 'ODA Theatre', 'city': 'prishtina',
+                    'aliases': ['oda theatre', 'oda theater', 'teatri oda']},
+    'national-theatre': {'name': 'National Theatre', 'city': 'prishtina',
+                         'aliases': ['national theatre of kosovo', 'national theatre', 'teatri kombëtar', 'teatri kombetar']},
+    'duplex-club': {'name': 'Duplex Club', 'city': 'prishtina',
+                    'aliases': ['duplex club']},
+    'dit-e-nat': {'name': "Dit' e Nat'", 'city': 'prishtina',
+                  'aliases': ["dit' e nat'", "dit e nat", "dite e nate"]},
+    'hamam-jazz-bar': {'name': 'Hamam Jazz Bar', 'city': 'prishtina',
+                       'aliases': ['hamam jazz bar', 'hamam jazz']},
+    'zanzi-jazz-bar': {'name': 'Zanzi Jazz Bar', 'city': 'prishtina',
+                       'aliases': ['zanzi jazz bar', 'zanzi']},
+    'termokiss': {'name': 'Termokiss', 'city': 'prishtina',
+                  'aliases': ['termokiss']},
+    'venom-nightclub': {'name': 'Venom Nightclub', 'city': 'prishtina',
+                        'aliases': ['venom nightclub', 'venom club']},
+    'germia-park': {'name': 'Germia Park', 'city': 'prishtina',
+                    'aliases': ['germia park', 'parku i gërmisë', 'parku i germise', 'gërmia', 'germia']},
+    'palace-of-youth': {'name': 'Pallati i Rinisë', 'city': 'prishtina',
+                        'aliases': ['pallati i rinisë', 'pallati i rinise', 'palace of youth', 'red hall', 'salla e kuqe']},
+    'mother-teresa-square': {'name': 'Mother Teresa Square', 'city': 'prishtina',
+                             'aliases': ['mother teresa square', 'mother theresa square', 'sheshi nëna terezë', 'sheshi nena tereze']},
+    'skanderbeg-square': {'name': 'Sheshi Skënderbeu', 'city': 'prishtina',
+                          'aliases': ['sheshi skënderbeu', 'sheshi skenderbeu', 'skanderbeg square']},
+    'fadil-vokrri-stadium': {'name': 'Stadiumi Fadil Vokrri', 'city': 'prishtina',
+                             'aliases': ['stadiumi fadil vokrri', 'fadil vokrri stadium', 'fadil vokrri']},
+    'kino-lumbardhi': {'name': 'Kino Lumbardhi', 'city': 'prizren',
+                       'aliases': ['kino lumbardhi', 'lumbardhi']},
+    'prizren-fortress': {'name': 'Prizren Fortress', 'city': 'prizren',
+                         'aliases': ['prizren fortress', 'kalaja e prizrenit', 'kalaja prizren']},
+    'rugova': {'name': 'Rugova Canyon', 'city': 'peja',
+               'aliases': ['rugova canyon', 'grykat e rugovës', 'rugova valley', 'rugova']},
+    'asim-vokshi': {'name': "Pallati i Kulturës 'Asim Vokshi'", 'city': 'gjakova',
+                    'aliases': ['asim vokshi']},
+}
+
+# Google Custom Search free tier: 100 queries per day
+# With 33 queries × 2 results = 66 results per run (33 of the 100 daily calls)
+# GOOGLE_DAILY_QUOTA can lower the budget, e.g. to 0 for a run that shares
+# its API key with a watcher on another machine
+GOOGLE_DAILY_QUOTA = int(os.environ.get('GOOGLE_DAILY_QUOTA', '100'))
+GOOGLE_MAX_QUERIES = 33  # Increased from 16 for better coverage
+
+# Queries spent per day, shared by every run and watcher in this checkout.
+# The quota resets at midnight Pacific time.
+GOOGLE_BUDGET_FILE = os.path.join('.cache', 'google-quota.json')
+GOOGLE_QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+# Eventbrite scraping: comma-separated CITIES keys (or 'all') in
+# EVENTBRITE_CITIES enables it; the country-wide listing is always included
+EVENTBRITE_COUNTRY_SLUG = 'kosovo'
+EVENTBRITE_MAX_PAGES = int(os.environ.get('EVENTBRITE_MAX_PAGES', '1'))
+EVENTBRITE_EVENTS_PER_PAGE = int(os.environ.get('EVENTBRITE_EVENTS_PER_PAGE', '3'))
+
+# Per-city JSON payloads, only written with --city-shards (relative to the
+# repo root). Not loaded by the site - output for hosts that serve events per city
+CITY_SHARDS_DIR = os.path.join('data', 'events')
+
+# Month names (and abbreviations) used when parsing event dates
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Field order for events written to MANUAL_EVENTS
+EVENT_FIELDS = [
+    'title', 'titleEn', 'description', 'descriptionEn', 'date', 'time',
+    'location', 'city', 'image', 'imageSrcset', 'imageSrcsetAvif',
+    'category', 'url', 'source', 'isLive',
+]
+
+# Optional fields are left out of the output when empty
+OPTIONAL_EVENT_FIELDS = {'city', 'imageSrcset', 'imageSrcsetAvif'}
+
+# Characters escaped in serialized events so scraped text can't close the
+# <script> tag, the MANUAL_EVENTS array, or break older JS parsers
+JS_UNSAFE_CHARS = str.maketrans({
+    '<': '\\u003c',
+    '>': '\\u003e',
+    '&': '\\u0026',
+    ']': '\\u005d',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+})
+
+# `key: value` pairs in an event object literal, with bare or quoted keys
+JS_FIELD_PATTERN = re.compile(
+    r'["\']?(\w+)["\']?\s*:\s*("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|true|false)'
+)
+
+# Checkpoint of completed scrape steps, so a failed run can resume
+CHECKPOINT_FILE = os.path.join('.cache', 'scraper-checkpoint.json')
+
+# Scrape results of the last successful run, used as cached inputs by --dry-run
+LAST_RUN_FILE = os.path.join('.cache', 'scraper-last-run.json')
+
+# Default similarity threshold for duplicate detection
+DUPLICATE_THRESHOLD = 0.75
+
+# Watch mode: seconds between polls per source (Google's interval is
+# derived from GOOGLE_DAILY_QUOTA), +/- WATCH_JITTER as a fraction
+WATCH_INTERVALS = {
+    'rss': 15 * 60,
+    'eventbrite': 60 * 60,
+}
+WATCH_JITTER = 0.1
+
+# Watch mode: new events are written out in batches
+WATCH_FLUSH_INTERVAL = 5 * 60
+WATCH_FLUSH_BATCH = 20
+
+# Words ignored when comparing titles (English and Albanian, diacritics folded)
+STOPWORDS = {
+    'the', 'a', 'an', 'in', 'at', 'on', 'for', 'of', 'and', 'or', 'to', 'with', 'by', 'from',
+    'e', 'i', 'te', 'ne', 'dhe', 'me', 'per', 'nga', 'se', 'ose', 'nje', 'tek', 'ku', 'si', 'ka', 'do',
+}
+
+# Month names in Albanian and English mapped to one key, so
+# "Nëntor" and "November" compare equal
+MONTH_ALIASES = {
+    'jan': ['january', 'janar', 'janari', 'janarit'],
+    'feb': ['february', 'shkurt', 'shkurti', 'shkurtit'],
+    'mar': ['march', 'mars', 'marsi', 'marsit'],
+    'apr': ['april', 'prill', 'prilli', 'prillit'],
+    'may': ['maj', 'maji', 'majit'],
+    'jun': ['june', 'qershor', 'qershori', 'qershorit'],
+    'jul': ['july', 'korrik', 'korriku', 'korrikut'],
+    'aug': ['august', 'gusht', 'gushti', 'gushtit'],
+    'sep': ['september', 'sept', 'shtator', 'shtatori', 'shtatorit'],
+    'oct': ['october', 'tetor', 'tetori', 'tetorit'],
+    'nov': ['november', 'nentor', 'nentori', 'nentorit'],
+    'dec': ['december', 'dhjetor', 'dhjetori', 'dhjetorit'],
+}
+
+# Sites whose name gets appended to scraped titles, e.g. "Jazz Night - Eventbrite"
+TITLE_NOISE_SITES = [
+    'eventbrite', 'facebook', 'instagram', 'youtube', 'tiktok', 'google',
+    'ticketmaster', 'allevents', 'meetup', 'tickets',
+]
+
+# Query parameters that only track clicks and never identify a page
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'aff', 'affiliate', 'si', '_ga', '_gl', 'aff_id',
+}
+
+# Canonical URLs that point at a single event page, as (host pattern,
+# path pattern). Only these are used as dedup keys - venue profiles,
+# listing pages and search results are shared by many events.
+EVENT_URL_PATTERNS = [
+    (r'(?:.+\.)?eventbrite\.[a-z.]+', r'/e/[^/]+'),
+    (r'facebook\.com', r'/events/\d+'),
+    (r'meetup\.com', r'/[^/]+/events/\d+'),
+    (r'allevents\.in', r'/[^/]+/[^/]+/\d+'),
+]
+
+# Redirect targets that are login walls or consent screens, not the event page
+LOGIN_PATH_PATTERN = re.compile(
+    r'/(?:login|log-in|signin|sign-in|signup|accounts/login|checkpoint|consent|auth|oauth)(?:[/.]|$)',
+    re.IGNORECASE
+)
+
+# Link checking: results are cached for LINK_CHECK_TTL_DAYS, requests to
+# the same host are spaced LINK_CHECK_HOST_INTERVAL seconds apart
+LINK_CACHE_FILE = os.path.join('.cache', 'link-status.json')
+LINK_CHECK_TTL_DAYS = 7
+LINK_CHECK_WORKERS = 8
+LINK_CHECK_HOST_INTERVAL = 1.0
+
+# HTTP status codes that mean the page is gone
+DEAD_LINK_STATUSES = {404, 410}
+
+# Never prune if more than this share of links look dead - likely a network problem
+LINK_PRUNE_MAX_FRACTION = 0.2
+
+# Profiling (--profile or SCRAPER_PROFILE=1): per-stage pstats and
+# collapsed stacks are written to SCRAPER_PROFILE_DIR
+PROFILE_DIR = os.environ.get('SCRAPER_PROFILE_DIR', 'profiles')
+PROFILE_TOP_N = 15
+PROFILE_SAMPLE_INTERVAL = 0.005
+
+# Local image cache (relative to the repo root, served by GitHub Pages)
+IMAGE_CACHE_DIR = os.path.join('images', 'events')
+IMAGE_MANIFEST = os.path.join(IMAGE_CACHE_DIR, 'manifest.json')
+
+# Remote images on the static cards in index.html
+STATIC_IMAGE_PATTERN = re.compile(r"background-image: url\('(https?://[^']+)'\)")
+
+# Thumbnail widths for the srcset (cards are ~400px wide, 2x for retina)
+THUMBNAIL_WIDTHS = [200, 400, 800]
+
+# Thumbnail formats in order of preference: (extension, Pillow format, save options)
+THUMBNAIL_FORMATS = [
+    ('avif', 'AVIF', {'quality': 50}),
+    ('webp', 'WEBP', {'quality': 75, 'method': 6}),
+]
+
+# Extensions for downloaded originals, keyed by Content-Type
+IMAGE_EXTENSIONS = {
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'image/webp': 'webp',
+    'image/gif': 'gif',
+    'image/avif': 'avif',
+}
+
 # Facebook scraping removed per user request
 
 
+# =============================================================================
+# CHECKPOINTING
+# =============================================================================
+
+def read_checkpoint_file(path):
+    """Read a checkpoint file, returning None if it's missing or corrupt"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def load_checkpoint(cached_only=False):
+    """
+    Load today's checkpoint so a re-run resumes where the last one stopped
+    Checkpoints from earlier days are discarded - their results are stale.
+
+    With cached_only (used by --dry-run) the last successful run is used
+    when there is no checkpoint, whatever its date, and steps missing from
+    it are skipped instead of fetched.
+    """
+    today = datetime.now().strftime('%Y-%m-%d')
+    checkpoint = read_checkpoint_file(CHECKPOINT_FILE)
+
+    if checkpoint and checkpoint.get('date') == today:
+        print(f"♻️  Resuming from checkpoint ({len(checkpoint['steps'])} completed steps)")
+    elif cached_only and read_checkpoint_file(LAST_RUN_FILE):
+        checkpoint = read_checkpoint_file(LAST_RUN_FILE)
+        print(f"♻️  Using cached results from {checkpoint['date']} ({len(checkpoint['steps'])} steps)")
+    else:
+        checkpoint = {'date': today, 'steps': {}}
+
+    checkpoint['cached_only'] = cached_only
+    return checkpoint
+
+
+def save_checkpoint(checkpoint):
+    """Write the checkpoint atomically, so a crash mid-write can't corrupt it"""
+    os.makedirs(os.path.dirname(CHECKPOINT_FILE), exist_ok=True)
+    tmp_file = CHECKPOINT_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'date': checkpoint['date'], 'steps': checkpoint['steps']}, f, ensure_ascii=False)
+    os.replace(tmp_file, CHECKPOINT_FILE)
+
+
+def clear_checkpoint():
+    """
+    Retire the checkpoint after a successful run, so the next run starts
+    fresh; it's kept as LAST_RUN_FILE for --dry-run
+    """
+    if os.path.exists(CHECKPOINT_FILE):
+        os.replace(CHECKPOINT_FILE, LAST_RUN_FILE)
+
+
+def run_checkpointed(checkpoint, key, fetch):
+    """
+    Run a scrape step once per day
+
+    Args:
+        checkpoint: Checkpoint dict from load_checkpoint (None disables checkpointing)
+        key: Unique step name, e.g. 'google:<query>'
+        fetch: Callable returning a list of events, or None on failure
+
+    Returns:
+        list: The step's events - from the checkpoint if it already completed.
+        Failed steps return [] and are not recorded, so they're retried.
+        In cached_only mode nothing is fetched or recorded.
+    """
+    if checkpoint is not None and key in checkpoint['steps']:
+        print(f"  ⏭️  Skipping {key} (done in checkpoint)")
+        return checkpoint['steps'][key]
+
+    if checkpoint is not None and checkpoint.get('cached_only'):
+        print(f"  ⏭️  Skipping {key} (not cached)")
+        return []
+
+    events = fetch()
+    if events is None:
+        return []
+
+    if checkpoint is not None:
+        checkpoint['steps'][key] = events
+        save_checkpoint(checkpoint)
+
+    return events
+
+
+# =============================================================================
+# LINK VALIDATION
+# =============================================================================
+
+def canonicalize_url(url):
+    """
+    Canonical form of a URL, used as a comparison key only - events keep
+    their original URL: https scheme, lowercase host without www./m., no default port,
+    no fragment, no tracking parameters, remaining parameters sorted,
+    no trailing slash
+    """
+    url = (url or '').strip()
+    if not url.lower().startswith(('http://', 'https://')):
+        return url
+
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if parts.port and parts.port not in (80, 443):
+        host = f'{host}:{parts.port}'
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+
+    return urlunsplit(('https', host, parts.path.rstrip('/') or '/', urlencode(query), ''))
+
+
+def is_event_url(canonical_url):
+    """True if a canonical URL is a single event's page (see EVENT_URL_PATTERNS)"""
+    parts = urlsplit(canonical_url)
+    return any(
+        re.fullmatch(host, parts.hostname or '') and re.fullmatch(path, parts.path)
+        for host, path in EVENT_URL_PATTERNS
+    )
+
+
+def same_site(url1, url2):
+    """True if two URLs are on the same host, ignoring scheme and www./m."""
+    return urlsplit(canonicalize_url(url1)).netloc == urlsplit(canonicalize_url(url2)).netloc
+
+
+def url_dedup_keys(events):
+    """
+    Canonical event-page URLs that identify exactly one event in `events`
+    Venue profiles, listing pages and search URLs don't identify an event,
+    and neither does an event URL shared by several events, so they are
+    left out.
+
+    Returns:
+        dict: canonical url -> title
+    """
+    counts = {}
+    for event in events:
+        url = canonicalize_url(event.get('url', ''))
+        if is_event_url(url):
+            counts.setdefault(url, []).append(event.get('title', ''))
+    return {url: titles[0] for url, titles in counts.items() if len(titles) == 1}
+
+
+def load_link_cache():
+    """Load cached link check results (url -> {status, final, checked})"""
+    try:
+        with open(LINK_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_link_cache(cache):
+    """Write the link check cache back to disk"""
+    os.makedirs(os.path.dirname(LINK_CACHE_FILE), exist_ok=True)
+    with open(LINK_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def check_link(url, wait_for_host):
+    """
+    Check a single URL with a HEAD request, following redirects
+    Falls back to GET for servers that reject HEAD.
+
+    Returns:
+        dict: {'status': HTTP status or None on error, 'final': URL after redirects}
+    """
+    wait_for_host(urlsplit(url).hostname or '')
+    try:
+        response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+        if response.status_code in (403, 405, 501):
+            response = requests.get(url, headers=HEADERS, timeout=10, allow_redirects=True, stream=True)
+            response.close()
+        return {'status': response.status_code, 'final': response.url}
+    except Exception as e:
+        print(f"  ⚠️ Error checking {url[:60]}: {e}")
+        return {'status': None, 'final': url}
+
+
+def check_links(urls):
+    """
+    Check many URLs concurrently, rate limited per host, using the cache
+    for anything checked in the last LINK_CHECK_TTL_DAYS
+
+    Returns:
+        dict: url -> {'status', 'final', 'checked'}
+    """
+    cache = load_link_cache()
+    today = datetime.now()
+
+    def is_fresh(entry):
+        checked = datetime.strptime(entry['checked'], '%Y-%m-%d')
+        return (today - checked).days < LINK_CHECK_TTL_DAYS
+
+    to_check = sorted({
+        url for url in urls
+        if url.startswith(('http://', 'https://')) and not (url in cache and is_fresh(cache[url]))
+    })
+
+    if to_check:
+        print(f"🔗 Checking {len(to_check)} links ({len(set(urls)) - len(to_check)} cached)...")
+
+        # Reserve a time slot per host so concurrent workers don't hammer one site
+        lock = threading.Lock()
+        next_slot = {}
+
+        def wait_for_host(host):
+            with lock:
+                now = time.monotonic()
+                slot = max(now, next_slot.get(host, now))
+                next_slot[host] = slot + LINK_CHECK_HOST_INTERVAL
+            time.sleep(slot - now)
+
+        with ThreadPoolExecutor(max_workers=LINK_CHECK_WORKERS) as pool:
+            results = pool.map(profiled_worker(lambda url: check_link(url, wait_for_host)), to_check)
+            for url, result in zip(to_check, results):
+                # Errors aren't cached - they're usually transient
+                if result['status'] is not None:
+                    cache[url] = dict(result, checked=today.strftime('%Y-%m-%d'))
+
+        save_link_cache(cache)
+
+    return {url: cache[url] for url in urls if url in cache}
+
+
+def cached_link_results(urls):
+    """Link statuses from the cache only, whatever their age - no requests"""
+    cache = load_link_cache()
+    return {url: cache[url] for url in urls if url in cache}
+
+
+def find_dead_links(urls, results):
+    """
+    Indexes of dead links in `urls`, given check results for them
+
+    Returns:
+        list: Indexes to prune, or None if more than LINK_PRUNE_MAX_FRACTION
+        look dead (usually a network problem, so nothing should be pruned)
+    """
+    dead = [i for i, url in enumerate(urls) if is_dead_link(results.get(url))]
+    if len(dead) > LINK_PRUNE_MAX_FRACTION * len(urls):
+        return None
+    return dead
+
+
+def is_dead_link(result):
+    """True if a check_links result says the page is gone"""
+    return bool(result) and result['status'] in DEAD_LINK_STATUSES
+
+
+def check_event_links(events):
+    """
+    Link validation stage for new events: drop events whose URL is dead
+    and follow redirects - but only to the same site, and never to a
+    login or consent page (Facebook/Instagram send anonymous clients there)
+    """
+    results = check_links([event['url'] for event in events])
+
+    alive = []
+    for event in events:
+        result = results.get(event['url'])
+        if is_dead_link(result):
+            print(f"  💀 Dropping dead link: '{event['title'][:50]}...' ({result['status']})")
+            continue
+        final = result['final'] if result else None
+        if final and same_site(final, event['url']) and not LOGIN_PATH_PATTERN.search(urlsplit(final).path):
+            event['url'] = final
+        alive.append(event)
+
+    return alive
+
+
+# =============================================================================
+# GEO / VENUE INDEX
+# =============================================================================
+
+def build_location_matcher():
+    """
+    Compile every city and venue alias into a single regex.
+    Returns (pattern, alias_lookup) where alias_lookup maps a lowercase
+    alias to ('city' | 'venue', key).
+    """
+    alias_lookup = {}
+    for key, city in CITIES.items():
+        for alias in city['aliases']:
+            alias_lookup[alias.lower()] = ('city', key)
+    for key, venue in VENUES.items():
+        for alias in venue['aliases']:
+            alias_lookup[alias.lower()] = ('venue', key)
+
+    # Longest aliases first so 'kino armata' wins over shorter overlaps
+    aliases = sorted(alias_lookup, key=len, reverse=True)
+    pattern = re.compile(
+        r'(?<!\w)(' + '|'.join(re.escape(a) for a in aliases) + r')(?!\w)',
+        re.IGNORECASE
+    )
+    return pattern, alias_lookup
+
+
+LOCATION_PATTERN, LOCATION_ALIASES = build_location_matcher()
+
+
+def resolve_location(*texts):
+    """
+    Resolve free text (location, title, description...) to known places
+    Texts are searched in order; a venue match also determines the city.
+
+    Returns:
+        tuple: (city_key or None, venue_key or None)
+    """
+    city_key = None
+
+    for text in texts:
+        if not text:
+            continue
+        for match in LOCATION_PATTERN.finditer(text):
+            kind, key = LOCATION_ALIASES[match.group(1).lower()]
+            if kind == 'venue':
+                return VENUES[key]['city'], key
+            if city_key is None:
+                city_key = key
+
+    return city_key, None
+
+
+def format_location(city_key, venue_key=None):
+    """Human readable location for resolved keys, e.g. 'Kino Armata, Prishtina'"""
+    if venue_key:
+        return f"{VENUES[venue_key]['name']}, {CITIES[VENUES[venue_key]['city']]['name']}"
+    if city_key:
+        return f"{CITIES[city_key]['name']}, Kosovo"
+    return 'Kosovo'
+
+
+def event_city(event):
+    """City key for an event, resolved from its location first, then its title"""
+    if event.get('city'):
+        return event['city']
+    city_key, _ = resolve_location(event.get('location', ''), event.get('title', ''))
+    return city_key
+
+
 # =============================================================================
 # DUPLICATE DETECTION SYSTEM
 # =============================================================================
 
-def normalize_title(title):
+def fold_text(text):
     """
-    Normalize a title for comparison:
-    - Lowercase
-    - Remove punctuation and special characters
-    - Remove extra whitespace
-    - Remove common filler words
+    Fold text for comparison: lowercase and strip diacritics (ë -> e, ç -> c)
     """
-    if not title:
-        return ""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    # Letters with strokes don't decompose
+    return folded.replace('đ', 'd').replace('ł', 'l').replace('ø', 'o')
+
 
-    # Lowercase
-    normalized = title.lower()
+def build_title_aliases():
+    """
+    Map folded city and month spellings to a single key each,
+    e.g. 'prishtine' / 'pristina' -> 'prishtina', 'nentor' -> 'nov'
+    Multi-word aliases are skipped since titles are compared word by word.
+    """
+    aliases = {}
+    for key, city in CITIES.items():
+        for alias in city['aliases']:
+            if ' ' not in alias:
+                aliases[fold_text(alias)] = key
+    for key, names in MONTH_ALIASES.items():
+        for name in names:
+            aliases[name] = key
+    return aliases
 
-    # Remove punctuation and special characters (keep alphanumeric and spaces)
-    normalized = re.sub(r'[^\w\s]', '', normalized)
 
-    # Remove extra whitespace
-    normalized = ' '.join(normalized.split())
+TITLE_ALIASES = build_title_aliases()
 
-    # Remove common filler words that don't add meaning for comparison
-    filler_words = ['the', 'a', 'an', 'in', 'at', 'on', 'for', 'of', 'and', 'or', 'to']
-    words = normalized.split()
-    words = [w for w in words if w not in filler_words]
+# Site names appended to titles, possibly several (" - Eventbrite | Facebook")
+# [^\S\n] is whitespace other than the newlines separating titles
+TITLE_NOISE_PATTERN = re.compile(
+    r'(?:[^\S\n]*[-|–—·:][^\S\n]*(?:' + '|'.join(TITLE_NOISE_SITES) + r')(?:\.com)?)+[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
 
-    return ' '.join(words)
+TITLE_TOKEN_PATTERN = re.compile(r'[^\W_]+')
 
 
-def calculate_similarity(title1, title2):
+def normalize_titles(titles):
     """
-    Calculate similarity ratio between two titles (0.0 to 1.0)
-    Uses SequenceMatcher for fuzzy matching
+    Normalize many titles in one pass - titles are joined into a single
+    string so site-suffix removal and Unicode folding run once for all:
+    - Remove source noise (" - Eventbrite", " | Facebook")
+    - Lowercase and strip diacritics
+    - Remove punctuation and extra whitespace
+    - Map city and month aliases to one spelling
+    - Remove English and Albanian filler words
     """
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
+    text = '\n'.join(re.sub(r'[\r\n]+', ' ', title or '') for title in titles)
+    text = fold_text(TITLE_NOISE_PATTERN.sub('', text))
+
+    normalized = []
+    for line in text.split('\n'):
+        words = (TITLE_ALIASES.get(word, word) for word in TITLE_TOKEN_PATTERN.findall(line))
+        normalized.append(' '.join(word for word in words if word not in STOPWORDS))
+    return normalized
+
 
+def similarity_normalized(norm1, norm2, threshold=0.0):
+    """
+    Similarity ratio between two normalized titles (0.0 to 1.0)
+    Pairs that can't reach the threshold are rejected using
+    SequenceMatcher's cheap upper bounds before computing the full ratio.
+    """
     if not norm1 or not norm2:
         return 0.0
 
@@ -125,97 +756,170 @@ def calculate_similarity(title1, title2):
         return 0.9
 
     # Fuzzy match using SequenceMatcher
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    matcher = SequenceMatcher(None, norm1, norm2)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
 
 
-def extract_existing_titles(html_content):
+def extract_existing_events(html_content):
     """
-    Extract all existing event titles from the MANUAL_EVENTS array in index.html
-    Returns a list of titles for duplicate checking
+    Extract all existing events from the MANUAL_EVENTS array in index.html
+    Returns a list of event dictionaries for duplicate checking
     """
-    existing_titles = []
-
-    # Find the MANUAL_EVENTS array
-    pattern = r'const MANUAL_EVENTS = \[(.*?)\];'
-    match = re.search(pattern, html_content, re.DOTALL)
+    match = re.search(r'const MANUAL_EVENTS = \[(.*?)\];', html_content, re.DOTALL)
 
     if not match:
-        return existing_titles
+        return []
 
-    events_str = match.group(1)
+    return [parse_js_event(obj_str) for obj_str, _, _, _ in parse_js_objects(match.group(1))]
+
+
+def build_dedup_index(existing_events):
+    """
+    Index existing titles for duplicate checking
+    - exact: normalized title -> list of (city_key, title), for exact-key matches
+    - by_city: city_key (or None) -> list of (normalized title, title), so
+      fuzzy matching only compares events in the same city (plus events
+      with no known city)
+    - urls: canonical url -> title, for URLs that identify a single event
+      (None once a URL turns out to be shared)
+    """
+    index = {'exact': {}, 'by_city': {}, 'urls': url_dedup_keys(existing_events)}
+    add_to_dedup_index(index, existing_events)
+    return index
+
+
+def add_to_dedup_index(index, events):
+    """Add events to a dedup index built by build_dedup_index, in place"""
+    titles = [event.get('title', '') for event in events]
+
+    # A URL shared with an indexed event no longer identifies one event
+    for url, title in url_dedup_keys(events).items():
+        if url in index['urls'] and index['urls'][url] != title:
+            index['urls'][url] = None
+        else:
+            index['urls'][url] = title
 
-    # Extract all title values using regex
-    # Matches both: title: "..." and title: '...'
-    title_pattern = r'title:\s*["\']([^"\']+)["\']'
-    titles = re.findall(title_pattern, events_str)
+    for event, title, normalized in zip(events, titles, normalize_titles(titles)):
+        city_key = event_city(event)
+        index['exact'].setdefault(normalized, []).append((city_key, title))
+        index['by_city'].setdefault(city_key, []).append((normalized, title))
 
-    existing_titles.extend(titles)
 
-    return existing_titles
+def cities_compatible(city1, city2):
+    """Events can only be duplicates in the same city - or if either city is unknown"""
+    return not city1 or not city2 or city1 == city2
 
 
-def is_duplicate(new_title, existing_titles, threshold=0.75):
+def find_exact(normalized, city_key, exact):
     """
-    Check if a new event title is a duplicate of any existing title
+    Look up a normalized title in a city compatible with city_key
 
     Args:
-        new_title: The title of the new event
-        existing_titles: List of existing event titles
-        threshold: Similarity threshold (0.75 = 75% similar is considered duplicate)
+        exact: dict of normalized title -> list of (city_key, title)
 
     Returns:
-        tuple: (is_duplicate: bool, matched_title: str or None)
+        str: The matched title, or None
     """
-    if not new_title or not existing_titles:
-        return False, None
+    for existing_city, existing_title in exact.get(normalized, []):
+        if cities_compatible(city_key, existing_city):
+            return existing_title
+    return None
 
-    new_normalized = normalize_title(new_title)
 
-    for existing_title in existing_titles:
-        similarity = calculate_similarity(new_title, existing_title)
+def find_similar(normalized, candidates, threshold=0.75):
+    """
+    Find the first candidate at least `threshold` similar to a normalized title
 
-        if similarity >= threshold:
-            return True, existing_title
+    Args:
+        normalized: Normalized title of the new event
+        candidates: List of (normalized title, title) tuples
 
-    return False, None
+    Returns:
+        tuple: (matched_title or None, similarity)
+    """
+    for candidate_normalized, candidate_title in candidates:
+        similarity = similarity_normalized(normalized, candidate_normalized, threshold)
+        if similarity >= threshold:
+            return candidate_title, similarity
+    return None, 0.0
 
 
-def filter_duplicates(new_events, existing_titles, threshold=0.75):
+def filter_duplicates(new_events, existing_events, threshold=0.75, report=None, dedup_index=None):
     """
     Filter out duplicate events from a list of new events
+    Events with the same canonical URL, or the same normalized title, are
+    found with dict lookups; only the remaining events go through fuzzy
+    matching.
 
     Args:
         new_events: List of new event dictionaries
-        existing_titles: List of existing event titles
+        existing_events: List of existing event dictionaries (title, location)
         threshold: Similarity threshold for duplicate detection
+        report: Optional list; each duplicate found is appended as a dict
+            with title, matched title, similarity and kind ('existing'/'batch')
+        dedup_index: Optional prebuilt index (see build_dedup_index) to use
+            instead of indexing existing_events
 
     Returns:
         list: Filtered events (non-duplicates only)
     """
     filtered_events = []
     duplicate_count = 0
-    seen_titles = set()  # Also track titles within this batch
+    seen_titles = {}  # Also track titles within this batch, like dedup_index['exact']
+
+    # Block by city: events in different known cities are never duplicates
+    if dedup_index is None:
+        dedup_index = build_dedup_index(existing_events)
+    unlocated = dedup_index['by_city'].get(None, [])
+    everything = [entry for entries in dedup_index['by_city'].values() for entry in entries]
 
-    for event in new_events:
-        title = event.get('title', '')
+    new_titles = [event.get('title', '') for event in new_events]
+    new_urls = url_dedup_keys(new_events)
 
-        # Check against existing events in index.html
-        is_dup, matched = is_duplicate(title, existing_titles, threshold)
+    for event, title, normalized in zip(new_events, new_titles, normalize_titles(new_titles)):
+        city_key = event_city(event)
+        matched, similarity = None, 0.0
 
-        if is_dup:
+        # Strongest key: the same page, by canonical URL
+        url = canonicalize_url(event.get('url', ''))
+        if url in new_urls and dedup_index['urls'].get(url):
+            matched, similarity = dedup_index['urls'][url], 1.0
+
+        # Then exact key - same normalized title in a compatible city
+        if matched is None and normalized:
+            matched = find_exact(normalized, city_key, dedup_index['exact'])
+            similarity = 1.0 if matched is not None else 0.0
+
+        # Then fuzzy matching against existing events in index.html
+        if matched is None:
+            candidates = dedup_index['by_city'].get(city_key, []) + unlocated if city_key else everything
+            matched, similarity = find_similar(normalized, candidates, threshold)
+
+        if matched is not None:
             print(f"  🔄 Skipping duplicate: '{title[:50]}...'")
             print(f"      ↳ Similar to: '{matched[:50]}...'")
             duplicate_count += 1
+            if report is not None:
+                report.append({
+                    'title': title,
+                    'matched': matched,
+                    'similarity': round(similarity, 3),
+                    'kind': 'existing',
+                })
             continue
 
         # Check against events already added in this batch
-        normalized = normalize_title(title)
-        if normalized in seen_titles:
+        batch_match = find_exact(normalized, city_key, seen_titles)
+        if batch_match is not None:
             print(f"  🔄 Skipping batch duplicate: '{title[:50]}...'")
             duplicate_count += 1
+            if report is not None:
+                report.append({'title': title, 'matched': batch_match, 'similarity': 1.0, 'kind': 'batch'})
             continue
 
-        seen_titles.add(normalized)
+        seen_titles.setdefault(normalized, []).append((city_key, title))
         filtered_events.append(event)
 
     if duplicate_count > 0:
@@ -253,6 +957,247 @@ def get_random_image(category):
     return random.choice(IMAGE_POOLS['outdoor'])
 
 
+# =============================================================================
+# IMAGE PIPELINE
+# =============================================================================
+
+def load_image_manifest():
+    """
+    Load the image cache manifest (source URL -> cached image entry)
+    Returns an empty dict if no images have been cached yet
+    """
+    try:
+        with open(IMAGE_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_image_manifest(manifest):
+    """Write the image cache manifest back to disk"""
+    os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+    with open(IMAGE_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def cached_image_path(digest, suffix):
+    """Path of a cached file, named after the content hash of the original"""
+    return os.path.join(IMAGE_CACHE_DIR, f'{digest}{suffix}').replace(os.sep, '/')
+
+
+def download_image(url):
+    """
+    Download an image and store it content-addressed in IMAGE_CACHE_DIR
+    Returns (digest, original_path) or (None, None) on failure
+    """
+    try:
+        response = requests.get(url, headers=HEADERS, timeout=15)
+    except Exception as e:
+        print(f"  ⚠️ Error downloading image {url[:60]}: {e}")
+        return None, None
+
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+    if response.status_code != 200 or content_type not in IMAGE_EXTENSIONS:
+        print(f"  ⚠️ Skipping image {url[:60]} ({response.status_code}, {content_type or 'unknown type'})")
+        return None, None
+
+    data = response.content
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    original_path = cached_image_path(digest, f'.{IMAGE_EXTENSIONS[content_type]}')
+
+    # Same bytes from a different URL - the file is already there
+    if not os.path.exists(original_path):
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        with open(original_path, 'wb') as f:
+            f.write(data)
+
+    return digest, original_path
+
+
+def generate_thumbnails(digest, original_path):
+    """
+    Generate resized thumbnails for every supported format
+    Returns a dict of format extension -> list of (path, width),
+    skipping widths larger than the original and existing files
+    """
+    thumbnails = {}
+
+    if Image is None:
+        return thumbnails
+
+    try:
+        with Image.open(original_path) as source:
+            source.load()
+            if source.mode not in ('RGB', 'RGBA'):
+                source = source.convert('RGBA' if 'transparency' in source.info else 'RGB')
+
+            # Always keep at least one width, even for tiny originals
+            widths = [w for w in THUMBNAIL_WIDTHS if w <= source.width] or [source.width]
+
+            for ext, pil_format, options in THUMBNAIL_FORMATS:
+                for width in widths:
+                    path = cached_image_path(digest, f'-{width}w.{ext}')
+                    if not os.path.exists(path):
+                        height = round(source.height * width / source.width)
+                        resized = source.resize((width, height), Image.LANCZOS)
+                        try:
+                            resized.save(path, pil_format, **options)
+                        except (KeyError, OSError, ValueError):
+                            # This Pillow build can't encode the format - skip it
+                            if os.path.exists(path):
+                                os.remove(path)
+                            break
+                    thumbnails.setdefault(ext, []).append((path, width))
+    except Exception as e:
+        print(f"  ⚠️ Error generating thumbnails for {original_path}: {e}")
+
+    return thumbnails
+
+
+def build_srcset(entries):
+    """Build a srcset attribute value from a list of (path, width)"""
+    return ', '.join(f'{path} {width}w' for path, width in entries)
+
+
+def cache_image(url, manifest):
+    """
+    Return the manifest entry for an image URL, downloading and
+    generating thumbnails only if it isn't cached yet
+    """
+    entry = manifest.get(url)
+    if entry and os.path.exists(entry['image']):
+        return entry
+
+    digest, original_path = download_image(url)
+    if not digest:
+        return None
+
+    thumbnails = generate_thumbnails(digest, original_path)
+    webp = thumbnails.get('webp', [])
+    avif = thumbnails.get('avif', [])
+
+    # Prefer the ~400px WebP as the plain src, fall back to the original
+    fallback = [path for path, width in webp if width <= 400]
+    entry = {
+        'image': fallback[-1] if fallback else original_path,
+        'imageSrcset': build_srcset(webp),
+        'imageSrcsetAvif': build_srcset(avif),
+    }
+    manifest[url] = entry
+    return entry
+
+
+def process_event_images(events):
+    """
+    Image pipeline stage: replace each event's remote image with a
+    local cached copy plus WebP/AVIF srcsets.
+    Events whose image can't be downloaded keep the remote URL.
+    """
+    print("🖼️  Caching event images...")
+
+    manifest = load_image_manifest()
+    cached_count = 0
+
+    for event in events:
+        url = event.get('image', '')
+        if not url.startswith(('http://', 'https://')):
+            continue
+
+        is_new = url not in manifest
+        entry = cache_image(url, manifest)
+        if entry:
+            event.update(entry)
+            cached_count += 1
+            # Persist each new image right away so an interrupted run keeps it
+            if is_new:
+                save_image_manifest(manifest)
+
+    save_image_manifest(manifest)
+    print(f"   {cached_count}/{len(events)} event images served locally")
+
+    return events
+
+
+def set_image_fields(obj_str, entry):
+    """
+    Point an event object string at a cached image: replace its image
+    value and add the srcset fields after it, in the object's own style
+    (quoted or bare keys, one field per line or compact)
+    """
+    image = next((m for m in JS_FIELD_PATTERN.finditer(obj_str) if m.group(1) == 'image'), None)
+    if not image:
+        return obj_str
+
+    quoted = image.group(0)[0] in '"\''
+    line_start = obj_str.rfind('\n', 0, image.start()) + 1
+    indent = obj_str[line_start:image.start()]
+    if line_start and not indent.strip():
+        separator = ',\n' + indent
+    else:
+        separator = ',' if quoted else ', '
+
+    fields = [('image', entry['image'])]
+    fields += [(key, entry[key]) for key in ('imageSrcset', 'imageSrcsetAvif') if entry.get(key)]
+    text = separator.join(
+        f'"{key}":{json.dumps(value)}' if quoted else f'{key}: {json.dumps(value)}'
+        for key, value in fields
+    )
+    return obj_str[:image.start()] + text + obj_str[image.end():]
+
+
+def localize_existing_images():
+    """
+    Image pipeline for what's already in index.html: cache the images of
+    existing MANUAL_EVENTS that still hotlink a remote URL, and of the
+    static cards, and point them at the local copies
+    """
+    print("🖼️  Caching existing event images...")
+
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    match = re.search(r'const MANUAL_EVENTS = \[(.*?)\];', html_content, re.DOTALL)
+    if not match:
+        print("❌ Could not find MANUAL_EVENTS array")
+        return
+
+    manifest = load_image_manifest()
+    localized = 0
+
+    # Static cards use a plain background image, so only the URL changes
+    def localize_static(image_match):
+        nonlocal localized
+        entry = cache_image(image_match.group(1), manifest)
+        if not entry:
+            return image_match.group(0)
+        localized += 1
+        return f"background-image: url('{entry['image']}')"
+
+    html_content = (
+        STATIC_IMAGE_PATTERN.sub(localize_static, html_content[:match.start()])
+        + html_content[match.start():]
+    )
+
+    object_strings = []
+    for obj_str, _, _, _ in parse_js_objects(match.group(1)):
+        event = parse_js_event(obj_str)
+        if event.get('image', '').startswith(('http://', 'https://')):
+            entry = cache_image(event['image'], manifest)
+            if entry:
+                obj_str = set_image_fields(obj_str, entry)
+                localized += 1
+        object_strings.append(obj_str)
+
+    save_image_manifest(manifest)
+
+    if not localized:
+        print("✅ No remote images left")
+        return
+
+    replace_manual_events(html_content, object_strings)
+    print(f"✅ {localized} existing images now served locally")
+
+
 def extract_date_from_text(text):
     """
     Extract event date from text using regex patterns
@@ -315,105 +1260,181 @@ def extract_date_from_text(text):
     return ('Coming Soon', False)
 
 
+def is_event_past(date_str, today=None):
+    """
+    Check if an event date has passed - mirrors isEventPast() in index.html
+    Understands "Nov 19", "November 19", ranges like "Nov 22-27" (the end
+    date counts) and "21.11.2025". Placeholders and unknown formats never
+    count as past.
+    """
+    today = today or datetime.now().date()
+    if not date_str:
+        return False
+
+    match = re.fullmatch(r'\s*(\d{1,2})\.(\d{1,2})\.(\d{4})\s*', date_str)
+    if match:
+        day, month, year = (int(part) for part in match.groups())
+        try:
+            return datetime(year, month, day).date() < today
+        except ValueError:
+            return False
+
+    # Use the last "<month> <day>" in the string, so ranges use their end date
+    matches = re.findall(r'([a-z]{3,9})\.?\s+(\d{1,2})(?:\s*-\s*(\d{1,2}))?', date_str.lower())
+    if not matches:
+        return False
+
+    month_name, day, end_day = matches[-1]
+    # Accept abbreviations like "sept", but not words like "market"
+    month_num = next((num for name, num in MONTHS.items() if name.startswith(month_name)), None)
+    if not month_num:
+        return False
+
+    try:
+        return datetime(today.year, month_num, int(end_day or day)).date() < today
+    except ValueError:
+        return False
+
+
 # Facebook scraping function removed per user request
 
 
-def scrape_eventbrite():
+def get_eventbrite_cities():
     """
-    Scrape events from Eventbrite - ALL Kosovo cities!
-    Public data, no API key needed
+    Eventbrite city pages to scrape, as (slug, city_key) pairs.
+    Configured with EVENTBRITE_CITIES (comma-separated CITIES keys or 'all');
+    empty means Eventbrite scraping is disabled.
     """
-    all_events = []
+    configured = os.environ.get('EVENTBRITE_CITIES', '').strip().lower()
+    if not configured:
+        return []
+
+    if configured == 'all':
+        keys = list(CITIES)
+    else:
+        keys = [key.strip() for key in configured.split(',') if key.strip()]
+
+    cities = []
+    for key in keys:
+        if key in CITIES and CITIES[key]['eventbrite']:
+            cities.append((CITIES[key]['eventbrite'], key))
+        else:
+            print(f"  ⚠️ Unknown Eventbrite city: {key}")
 
-    # Major Kosovo cities to search
-    KOSOVO_CITIES = [
-        ('pristina', 'Prishtina'),
-        ('prizren', 'Prizren'),
-        ('peja', 'Peja'),
-        ('gjakova', 'Gjakova'),
-        ('gjilan', 'Gjilan'),
-        ('ferizaj', 'Ferizaj'),
-        ('mitrovica', 'Mitrovica'),
-        ('kosovo', 'Kosovo')  # General Kosovo events
-    ]
+    # General Kosovo events
+    cities.append((EVENTBRITE_COUNTRY_SLUG, None))
+    return cities
+
+
+def scrape_eventbrite_city(city_slug, city_key):
+    """
+    Scrape one Eventbrite city page, following up to EVENTBRITE_MAX_PAGES pages
+    and keeping up to EVENTBRITE_EVENTS_PER_PAGE events from each
+    Returns a list of events, or None if a request failed
+    """
+    events = []
+    seen_titles = set()
+    city_name = CITIES[city_key]['name'] if city_key else 'Kosovo'
+
+    for page in range(1, EVENTBRITE_MAX_PAGES + 1):
+        page_limit = len(events) + EVENTBRITE_EVENTS_PER_PAGE
 
-    for city_slug, city_name in KOSOVO_CITIES:
         try:
-            print(f"🔍 Searching Eventbrite: {city_name}...")
+            print(f"🔍 Searching Eventbrite: {city_name} (page {page})...")
             url = f"https://www.eventbrite.com/d/kosovo--{city_slug}/events/"
-            response = requests.get(url, headers=HEADERS, timeout=10)
+            response = requests.get(url, headers=HEADERS, params={'page': page}, timeout=10)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # Eventbrite uses structured data - look for event cards
-                event_items = soup.find_all('div', class_='discover-search-desktop-card')[:3]  # Get first 3 per city
-
-                for item in event_items:
-                    try:
-                        # Extract event details
-                        title_elem = item.find('h2') or item.find('h3')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-
-                        if title:
-                            # Avoid duplicates
-                            if not any(e['title'] == title for e in all_events):
-                                # IMPORTANT: Keep original title - NEVER translate event titles!
-                                # Only descriptions can be translated, titles stay in original language
-                                event = {
-                                    'title': title,  # Original title (NEVER translate)
-                                    'titleEn': title,  # Keep same as original
-                                    'description': f'Event in {city_name}, Kosovo. Check Eventbrite for full details.',
-                                    'descriptionEn': f'Event in {city_name}, Kosovo. Check Eventbrite for full details.',
-                                    'date': 'Coming Soon',
-                                    'time': 'TBA',
-                                    'location': f'{city_name}, Kosovo',
-                                    'image': 'https://images.unsplash.com/photo-1492684223066-81342ee5ff30?w=400',
-                                    'category': 'outdoor',
-                                    'url': url,
-                                    'source': f'Eventbrite ({city_name})',
-                                    'isLive': True
-                                }
-                                all_events.append(event)
-                                print(f"  ✅ {city_name}: {title[:50]}...")
-                    except Exception as e:
-                        print(f"  ⚠️ Error parsing event: {e}")
-                        continue
-            else:
+            if response.status_code != 200:
                 print(f"  ℹ️  No events found for {city_name}")
+                break
+
+            soup = BeautifulSoup(response.text, 'html.parser')
+
+            # Eventbrite uses structured data - look for event cards
+            event_items = soup.find_all('div', class_='discover-search-desktop-card')
+            if not event_items:
+                break
+
+            for item in event_items:
+                if len(events) >= page_limit:
+                    break
+                try:
+                    # Extract event details
+                    title_elem = item.find('h2') or item.find('h3')
+                    title = title_elem.get_text(strip=True) if title_elem else None
+
+                    # Avoid duplicates
+                    if not title or title in seen_titles:
+                        continue
+                    seen_titles.add(title)
+
+                    # The card text usually names the venue
+                    event_city_key, venue_key = resolve_location(item.get_text(' ', strip=True), title)
+                    event_city_key = event_city_key or city_key
+
+                    # Link to the event itself rather than the city listing
+                    link_elem = item.find('a', href=True)
+                    event_url = urljoin(url, link_elem['href']) if link_elem else url
+
+                    # IMPORTANT: Keep original title - NEVER translate event titles!
+                    # Only descriptions can be translated, titles stay in original language
+                    event = {
+                        'title': title,  # Original title (NEVER translate)
+                        'titleEn': title,  # Keep same as original
+                        'description': f'Event in {city_name}, Kosovo. Check Eventbrite for full details.',
+                        'descriptionEn': f'Event in {city_name}, Kosovo. Check Eventbrite for full details.',
+                        'date': 'Coming Soon',
+                        'time': 'TBA',
+                        'location': format_location(event_city_key, venue_key),
+                        'city': event_city_key or '',
+                        'image': 'https://images.unsplash.com/photo-1492684223066-81342ee5ff30?w=400',
+                        'category': 'outdoor',
+                        'url': event_url or url,
+                        'source': f'Eventbrite ({city_name})',
+                        'isLive': True
+                    }
+                    events.append(event)
+                    print(f"  ✅ {city_name}: {title[:50]}...")
+                except Exception as e:
+                    print(f"  ⚠️ Error parsing event: {e}")
+                    continue
 
             # Be polite - small delay between requests
-            import time
             time.sleep(0.5)
 
         except Exception as e:
             print(f"  ❌ Error with {city_name}: {e}")
+            return None
 
-    return all_events
+    return events
 
 
-def scrape_google_events():
+def scrape_eventbrite(checkpoint=None):
     """
-    Search Google for Kosovo events using Custom Search API
-    Requires GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID in environment
-
-    To set up:
-    1. Get API key: https://developers.google.com/custom-search/v1/overview
-    2. Create Search Engine: https://programmablesearchengine.google.com/
-    3. Add to GitHub Secrets: GOOGLE_API_KEY, GOOGLE_SEARCH_ENGINE_ID
+    Scrape events from Eventbrite city pages (see get_eventbrite_cities)
+    Each city is checkpointed, so a resumed run skips cities already done.
+    Public data, no API key needed
     """
-    events = []
+    all_events = []
 
-    api_key = os.environ.get('GOOGLE_API_KEY', '')
-    search_engine_id = os.environ.get('GOOGLE_SEARCH_ENGINE_ID', '')
+    for city_slug, city_key in get_eventbrite_cities():
+        city_events = run_checkpointed(
+            checkpoint, f'eventbrite:{city_slug}',
+            lambda: scrape_eventbrite_city(city_slug, city_key)
+        )
 
-    if not api_key or not search_engine_id:
-        print("⚠️  Google Custom Search not configured")
-        print("   Add GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID to GitHub Secrets")
-        return events
+        for event in city_events:
+            # Avoid duplicates across city pages
+            if not any(e['title'] == event['title'] for e in all_events):
+                all_events.append(event)
 
-    print("🔍 Searching Google for Kosovo events...")
+    return all_events
 
+
+def get_google_search_queries():
+    """
+    Google Custom Search queries for the current month and year
+    """
     # Comprehensive search queries - organized by type
     from datetime import datetime
     current_month = datetime.now().strftime("%B %Y")
@@ -465,72 +1486,158 @@ def scrape_google_events():
     ]
 
     # Limit queries to stay within Google's free tier (100 searches/day)
-    # With 33 queries × 2 results = 66 API calls (well under 100/day limit)
-    MAX_QUERIES = 33  # Increased from 16 for better coverage
-    search_queries = search_queries[:MAX_QUERIES]
+    search_queries = search_queries[:GOOGLE_MAX_QUERIES]
+
+    return search_queries
+
 
-    print(f"   Running {len(search_queries)} searches (max {MAX_QUERIES*2} results)")
+def google_quota_day():
+    """Current day of Google's quota window, as YYYY-MM-DD"""
+    return datetime.now(GOOGLE_QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+def load_google_budget():
+    """Queries spent today, from GOOGLE_BUDGET_FILE (0 on a new day)"""
+    try:
+        with open(GOOGLE_BUDGET_FILE, 'r', encoding='utf-8') as f:
+            budget = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    return budget.get('spent', 0) if budget.get('day') == google_quota_day() else 0
+
+
+def spend_google_query():
+    """
+    Record one query against today's budget before it's sent
+
+    Returns:
+        bool: False (and nothing recorded) if today's budget is used up
+    """
+    spent = load_google_budget()
+    if spent >= GOOGLE_DAILY_QUOTA:
+        return False
+
+    os.makedirs(os.path.dirname(GOOGLE_BUDGET_FILE), exist_ok=True)
+    with open(GOOGLE_BUDGET_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'day': google_quota_day(), 'spent': spent + 1}, f)
+    return True
+
+
+def scrape_google_events(checkpoint=None):
+    """
+    Search Google for Kosovo events using Custom Search API
+    Requires GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID in environment
+
+    Each query is checkpointed, so a resumed run doesn't spend quota twice,
+    and counted in GOOGLE_BUDGET_FILE: once GOOGLE_DAILY_QUOTA queries
+    have been sent today, the remaining queries are skipped.
+
+    To set up:
+    1. Get API key: https://developers.google.com/custom-search/v1/overview
+    2. Create Search Engine: https://programmablesearchengine.google.com/
+    3. Add to GitHub Secrets: GOOGLE_API_KEY, GOOGLE_SEARCH_ENGINE_ID
+    """
+    events = []
+
+    api_key = os.environ.get('GOOGLE_API_KEY', '')
+    search_engine_id = os.environ.get('GOOGLE_SEARCH_ENGINE_ID', '')
+
+    cached_only = checkpoint is not None and checkpoint.get('cached_only')
+    if (not api_key or not search_engine_id) and not cached_only:
+        print("⚠️  Google Custom Search not configured")
+        print("   Add GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID to GitHub Secrets")
+        return events
+
+    print("🔍 Searching Google for Kosovo events...")
+
+    search_queries = get_google_search_queries()
+
+    print(f"   Running {len(search_queries)} searches (max {GOOGLE_MAX_QUERIES*2} results)")
 
     for query in search_queries:
-        try:
-            url = "https://www.googleapis.com/customsearch/v1"
-            params = {
-                'key': api_key,
-                'cx': search_engine_id,
-                'q': query,
-                'num': 2  # Get 2 results per query (stay under free tier limit)
-            }
+        # Completed queries come from the checkpoint - no API quota spent
+        query_events = run_checkpointed(
+            checkpoint, f'google:{query}',
+            lambda: search_google(query, api_key, search_engine_id)
+        )
+
+        # Add all events (with and without specific dates)
+        # Events without dates will appear at the end of the list
+        for event in query_events:
+            if not any(e['title'] == event['title'] for e in events):
+                events.append(event)
+                if event['date'] != 'Coming Soon':
+                    print(f"  ✅ Found: {event['title'][:50]}... [{event['category']}] on {event['date']}")
+                else:
+                    print(f"  ✅ Added (no date): {event['title'][:50]}... [{event['category']}]")
 
-            response = requests.get(url, params=params, timeout=10)
+    return events
 
-            if response.status_code == 200:
-                data = response.json()
-
-                if 'items' in data:
-                    for item in data['items']:
-                        title = item.get('title', 'Event in Kosovo')
-                        snippet = item.get('snippet', 'Check Google for details')
-                        link = item.get('link', 'https://google.com')
-
-                        # Extract date from title and snippet
-                        date_str, has_specific_date = extract_date_from_text(title + ' ' + snippet)
-
-                        # Add all events (with and without specific dates)
-                        # Events without dates will appear at the end of the list
-                        if not any(e['title'] == title for e in events):
-                            # Intelligently detect category and select diverse image
-                            category = detect_category(title, snippet)
-                            image = get_random_image(category)
-
-                            # IMPORTANT: Keep original title - NEVER translate event titles!
-                            # Only descriptions can be translated, titles stay in original language
-                            event = {
-                                'title': title[:100],  # Original title (NEVER translate)
-                                'titleEn': title[:100],  # Keep same as original
-                                'description': snippet[:200],
-                                'descriptionEn': snippet[:200],
-                                'date': date_str,  # Will be "Coming Soon" if no date found
-                                'time': 'Check Website',
-                                'location': 'Kosovo',
-                                'image': image,
-                                'category': category,
-                                'url': link,
-                                'source': 'Google Search',
-                                'isLive': True
-                            }
-                            events.append(event)
-                            if has_specific_date:
-                                print(f"  ✅ Found: {title[:50]}... [{category}] on {date_str}")
-                            else:
-                                print(f"  ✅ Added (no date): {title[:50]}... [{category}]")
-            else:
-                print(f"  ❌ Error: {response.status_code}")
-
-            import time
-            time.sleep(0.5)  # Respect API rate limits
 
-        except Exception as e:
-            print(f"  ⚠️ Error searching Google: {e}")
+def search_google(query, api_key, search_engine_id):
+    """
+    Run a single Google Custom Search query
+    Returns a list of events, or None if the request failed
+    """
+    events = []
+
+    if not spend_google_query():
+        print(f"  ⏸️  Daily Google quota used ({GOOGLE_DAILY_QUOTA} queries), skipping: {query}")
+        return None
+
+    try:
+        url = "https://www.googleapis.com/customsearch/v1"
+        params = {
+            'key': api_key,
+            'cx': search_engine_id,
+            'q': query,
+            'num': 2  # Get 2 results per query (stay under free tier limit)
+        }
+
+        response = requests.get(url, params=params, timeout=10)
+
+        if response.status_code != 200:
+            print(f"  ❌ Error: {response.status_code}")
+            return None
+
+        data = response.json()
+
+        for item in data.get('items', []):
+            title = item.get('title', 'Event in Kosovo')
+            snippet = item.get('snippet', 'Check Google for details')
+            link = item.get('link', 'https://google.com')
+
+            # Extract date from title and snippet
+            date_str, has_specific_date = extract_date_from_text(title + ' ' + snippet)
+
+            # Intelligently detect category and select diverse image
+            category = detect_category(title, snippet)
+            image = get_random_image(category)
+            city_key, venue_key = resolve_location(title, snippet)
+
+            # IMPORTANT: Keep original title - NEVER translate event titles!
+            # Only descriptions can be translated, titles stay in original language
+            events.append({
+                'title': title[:100],  # Original title (NEVER translate)
+                'titleEn': title[:100],  # Keep same as original
+                'description': snippet[:200],
+                'descriptionEn': snippet[:200],
+                'date': date_str,  # Will be "Coming Soon" if no date found
+                'time': 'Check Website',
+                'location': format_location(city_key, venue_key),
+                'city': city_key or '',
+                'image': image,
+                'category': category,
+                'url': link,
+                'source': 'Google Search',
+                'isLive': True
+            })
+
+        time.sleep(0.5)  # Respect API rate limits
+
+    except Exception as e:
+        print(f"  ⚠️ Error searching Google: {e}")
+        return None
 
     return events
 
@@ -610,9 +1717,11 @@ def scrape_public_calendar_feeds():
     return events
 
 
-def scrape_events():
+def scrape_events(checkpoint=None):
     """
     Main scraper - combines all sources
+    Each source checkpoints its own requests (per query / per city page),
+    so on resume only the steps that didn't complete are fetched again
     Returns list of event dictionaries
     """
     all_events = []
@@ -621,9 +1730,13 @@ def scrape_events():
     print("=" * 50)
 
     # Scrape from Google Custom Search (if configured)
-    google_events = scrape_google_events()
+    google_events = scrape_google_events(checkpoint)
     all_events.extend(google_events)
 
+    # Eventbrite city pages (if EVENTBRITE_CITIES is set)
+    eventbrite_events = scrape_eventbrite(checkpoint)
+    all_events.extend(eventbrite_events)
+
     # Instagram scraping (not recommended - see function for details)
     instagram_events = scrape_instagram_hashtags()
     all_events.extend(instagram_events)
@@ -631,12 +1744,42 @@ def scrape_events():
     print("=" * 50)
     print(f"✅ Found {len(all_events)} total new events")
     print(f"   - Google Search: {len(google_events)} events")
+    print(f"   - Eventbrite: {len(eventbrite_events)} events")
     print(f"   - Instagram: {len(instagram_events)} events")
 
     return all_events
 
 
-def update_html_file(events):
+# =============================================================================
+# EVENT SERIALIZATION
+# =============================================================================
+
+def serialize_event(event):
+    """
+    Serialize one event as a compact JSON object literal (valid JS)
+    Fields follow EVENT_FIELDS; values are written unchanged, with
+    JS_UNSAFE_CHARS escaped so the output is safe inside <script>.
+    """
+    if not event.get('city'):
+        event = {**event, 'city': event_city(event) or ''}
+
+    fields = {}
+    for field in EVENT_FIELDS:
+        value = event.get(field, '')
+        if field in OPTIONAL_EVENT_FIELDS and not value:
+            continue
+        fields[field] = bool(value) if field == 'isLive' else str(value or '')
+
+    # Objects are flat, so any ']' left in the output is inside a string
+    return json.dumps(fields, ensure_ascii=False, separators=(',', ':')).translate(JS_UNSAFE_CHARS)
+
+
+def serialize_events(events):
+    """Serialize events for MANUAL_EVENTS, one compact object per line"""
+    return ',\n            '.join(serialize_event(event) for event in events)
+
+
+def update_html_file(events, threshold=DUPLICATE_THRESHOLD):
     """
     Update index.html with new events
     Includes duplicate detection to prevent adding similar events
@@ -661,62 +1804,47 @@ def update_html_file(events):
 
     # DUPLICATE DETECTION: Extract existing titles and filter duplicates
     print("🔍 Checking for duplicates...")
-    existing_titles = extract_existing_titles(html_content)
-    print(f"   Found {len(existing_titles)} existing events to check against")
+    existing_events = extract_existing_events(html_content)
+    print(f"   Found {len(existing_events)} existing events to check against")
 
     # Filter out duplicates before adding
-    events = filter_duplicates(events, existing_titles, threshold=0.75)
+    events = filter_duplicates(events, existing_events, threshold=threshold)
 
     if not events:
         print("ℹ️  All scraped events were duplicates - nothing new to add")
         return
 
+    # Drop events whose page is already gone
+    events = check_event_links(events)
+
+    if not events:
+        print("ℹ️  All new events had dead links - nothing new to add")
+        return
+
     print(f"✅ {len(events)} unique new events to add")
 
-    # Parse existing events
-    existing_events_str = match.group(1)
-
-    # Helper function to escape quotes and special characters
-    def escape_js_string(s):
-        if not s:
-            return ""
-        # Replace double quotes with single quotes to avoid breaking strings
-        s = s.replace('"', "'")
-        # Remove newlines and carriage returns
-        s = s.replace('\n', ' ').replace('\r', ' ')
-        # Remove multiple spaces
-        s = re.sub(r'\s+', ' ', s)
-        return s.strip()
-
-    # Generate new events JavaScript
-    new_events_js = []
-    for event in events:
-        event_js = f"""
-            {{
-                title: "{escape_js_string(event['title'])}",
-                titleEn: "{escape_js_string(event['titleEn'])}",
-                description: "{escape_js_string(event['description'])}",
-                descriptionEn: "{escape_js_string(event['descriptionEn'])}",
-                date: "{escape_js_string(event['date'])}",
-                time: "{escape_js_string(event['time'])}",
-                location: "{escape_js_string(event['location'])}",
-                image: "{event['image']}",
-                category: "{event['category']}",
-                url: "{event['url']}",
-                source: "{escape_js_string(event['source'])}",
-                isLive: {str(event['isLive']).lower()}
-            }}"""
-        new_events_js.append(event_js)
-
-    # Combine existing and new events
-    combined_events = existing_events_str.strip() + ',\n' + ',\n'.join(new_events_js)
-
-    # Update HTML content
-    updated_html = re.sub(
-        pattern,
-        f'const MANUAL_EVENTS = [{combined_events}\n        ];',
-        html_content,
-        flags=re.DOTALL
+    # Download images only for events that will actually be added
+    events = process_event_images(events)
+
+    append_events_to_html(html_content, match, events)
+
+
+def append_events_to_html(html_content, match, events):
+    """
+    Append serialized events to MANUAL_EVENTS and write index.html
+    `match` is the MANUAL_EVENTS regex match in html_content
+    """
+    existing_events_str = match.group(1).rstrip().rstrip(',')
+    new_events_js = serialize_events(events)
+    if existing_events_str.strip():
+        combined_events = f'{existing_events_str},\n            {new_events_js}'
+    else:
+        combined_events = f'\n            {new_events_js}'
+
+    updated_html = (
+        html_content[:match.start(1)]
+        + f'{combined_events}\n        '
+        + html_content[match.end(1):]
     )
 
     # Write updated HTML
@@ -729,7 +1857,8 @@ def update_html_file(events):
 def parse_js_objects(events_str):
     """
     Parse JavaScript objects from a string by matching braces.
-    Returns list of (object_string, title) tuples.
+    Braces inside string values are ignored.
+    Returns list of (object_string, title, start, end) tuples.
     """
     objects = []
     i = 0
@@ -740,13 +1869,22 @@ def parse_js_objects(events_str):
         if events_str[i] == '{':
             start = i
             brace_count = 1
+            open_quote = None
             i += 1
 
             # Find matching closing brace
             while i < n and brace_count > 0:
-                if events_str[i] == '{':
+                char = events_str[i]
+                if open_quote:
+                    if char == '\\':
+                        i += 1  # Skip the escaped character
+                    elif char == open_quote:
+                        open_quote = None
+                elif char in ('"', "'"):
+                    open_quote = char
+                elif char == '{':
                     brace_count += 1
-                elif events_str[i] == '}':
+                elif char == '}':
                     brace_count -= 1
                 i += 1
 
@@ -754,9 +1892,8 @@ def parse_js_objects(events_str):
                 obj_str = events_str[start:i]
 
                 # Extract title from this object
-                title_match = re.search(r'title:\s*["\']([^"\']+)["\']', obj_str)
-                if title_match:
-                    title = title_match.group(1)
+                title = parse_js_event(obj_str).get('title')
+                if title:
                     objects.append((obj_str, title, start, i))
         else:
             i += 1
@@ -764,6 +1901,51 @@ def parse_js_objects(events_str):
     return objects
 
 
+def parse_js_event(obj_str):
+    """
+    Parse a single event object literal from MANUAL_EVENTS into a dict.
+    Handles both the hand-written `key: "string"` style and the JSON
+    written by serialize_event; unknown value types are ignored.
+    """
+    event = {}
+    for key, value in JS_FIELD_PATTERN.findall(obj_str):
+        if value in ('true', 'false'):
+            event[key] = value == 'true'
+        elif value.startswith('"'):
+            try:
+                event[key] = json.loads(value)
+            except json.JSONDecodeError:
+                # JS-only escapes such as \' aren't valid JSON
+                event[key] = re.sub(r'\\(.)', r'\1', value[1:-1])
+        else:
+            event[key] = re.sub(r'\\(.)', r'\1', value[1:-1])
+    return event
+
+
+def find_existing_duplicates(event_objects):
+    """
+    Find repeated events among parsed MANUAL_EVENTS objects
+    Returns (unique object strings, titles of the duplicates)
+    """
+    seen_titles = {}
+    unique_objects = []
+    duplicate_titles = []
+
+    titles = [title for _, title, _, _ in event_objects]
+
+    for (obj_str, title, start, end), normalized in zip(event_objects, normalize_titles(titles)):
+        # Same title in two different known cities is not a duplicate
+        city_key = event_city(parse_js_event(obj_str))
+
+        if find_exact(normalized, city_key, seen_titles) is not None:
+            duplicate_titles.append(title)
+        else:
+            seen_titles.setdefault(normalized, []).append((city_key, title))
+            unique_objects.append(obj_str)
+
+    return unique_objects, duplicate_titles
+
+
 def cleanup_existing_duplicates():
     """
     Remove existing duplicate events from index.html
@@ -795,21 +1977,11 @@ def cleanup_existing_duplicates():
 
     print(f"   Found {len(event_objects)} total events")
 
-    # Track seen titles and identify duplicates
-    seen_titles = {}  # normalized_title -> first occurrence index
-    unique_objects = []
-    duplicate_count = 0
+    unique_objects, duplicate_titles = find_existing_duplicates(event_objects)
+    duplicate_count = len(duplicate_titles)
 
-    for obj_str, title, start, end in event_objects:
-        normalized = normalize_title(title)
-
-        if normalized in seen_titles:
-            # This is a duplicate - skip it
-            print(f"   🔄 Duplicate found: '{title[:50]}...'")
-            duplicate_count += 1
-        else:
-            seen_titles[normalized] = len(unique_objects)
-            unique_objects.append(obj_str)
+    for title in duplicate_titles:
+        print(f"   🔄 Duplicate found: '{title[:50]}...'")
 
     if duplicate_count == 0:
         print("✅ No duplicates found!")
@@ -818,14 +1990,21 @@ def cleanup_existing_duplicates():
     print(f"   Removing {duplicate_count} duplicate events...")
 
     # Rebuild the events array with only unique events
-    new_events_str = ',\n            '.join(unique_objects)
+    replace_manual_events(html_content, unique_objects)
+
+    print(f"✅ Removed {duplicate_count} duplicate events")
+
+
+def replace_manual_events(html_content, object_strings):
+    """Rebuild MANUAL_EVENTS from event object strings and write index.html"""
+    new_events_str = ',\n            '.join(object_strings)
 
     # Update the HTML content
     new_array = f'const MANUAL_EVENTS = [\n            {new_events_str}\n        ];'
 
     updated_html = re.sub(
         r'const MANUAL_EVENTS = \[.*?\];',
-        new_array,
+        lambda m: new_array,
         html_content,
         flags=re.DOTALL
     )
@@ -834,26 +2013,531 @@ def cleanup_existing_duplicates():
     with open('index.html', 'w', encoding='utf-8') as f:
         f.write(updated_html)
 
-    print(f"✅ Removed {duplicate_count} duplicate events")
+
+def prune_dead_events():
+    """
+    Remove events whose link is dead (404/410) from index.html
+    Links are checked concurrently and cached, so most runs only check
+    new or expired entries. Pruning is skipped if too many links look
+    dead at once, which usually means a network problem.
+    """
+    print("🔗 Pruning events with dead links...")
+
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    match = re.search(r'const MANUAL_EVENTS = \[(.*?)\];', html_content, re.DOTALL)
+    if not match:
+        print("❌ Could not find MANUAL_EVENTS array")
+        return
+
+    event_objects = parse_js_objects(match.group(1))
+    urls = [parse_js_event(obj_str).get('url', '') for obj_str, _, _, _ in event_objects]
+    results = check_links(urls)
+
+    dead = find_dead_links(urls, results)
+    if dead is None:
+        print(f"⚠️  Too many of {len(event_objects)} links look dead - not pruning")
+        return
+
+    if not dead:
+        print("✅ No dead links found!")
+        return
+
+    for i in dead:
+        print(f"   💀 Dead link: '{event_objects[i][1][:50]}...' ({urls[i][:60]})")
+
+    dead = set(dead)
+    replace_manual_events(html_content, [obj[0] for i, obj in enumerate(event_objects) if i not in dead])
+
+    print(f"✅ Removed {len(dead)} events with dead links")
+
+
+def write_city_shards(shards_dir, events=None):
+    """
+    Write the events in index.html as one JSON payload per city
+    (<shards_dir>/<city>.json, 'kosovo.json' for unknown cities)
+    plus an index.json with the event count per shard
+    Pass `events` to skip re-reading index.html (watch mode keeps them in memory)
+    """
+    print("🗂️  Writing per-city event payloads...")
+
+    if events is None:
+        with open('index.html', 'r', encoding='utf-8') as f:
+            events = extract_existing_events(f.read())
+
+    shards = {}
+    for event in events:
+        event = dict(event)
+        city_key = event_city(event) or 'kosovo'
+        event['city'] = city_key
+        shards.setdefault(city_key, []).append(event)
+
+    os.makedirs(shards_dir, exist_ok=True)
+    for city_key, events in shards.items():
+        with open(os.path.join(shards_dir, f'{city_key}.json'), 'w', encoding='utf-8') as f:
+            json.dump(events, f, ensure_ascii=False, separators=(',', ':'))
+
+    with open(os.path.join(shards_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump({key: len(events) for key, events in sorted(shards.items())}, f, indent=2)
+
+    print(f"✅ Wrote {len(shards)} city payloads to {shards_dir}")
+
+
+# =============================================================================
+# WATCH MODE
+# =============================================================================
+
+def get_watch_sources():
+    """
+    Sources polled in watch mode, as name -> (scrape function, interval in seconds)
+    Google gets floor(quota / queries) full polls a day, spaced so even the
+    shortest jittered interval fits; it's left out if not even one fits.
+    The budget file is the hard limit, since the daily run spends from it too.
+    """
+    sources = {
+        'eventbrite': (scrape_eventbrite, WATCH_INTERVALS['eventbrite']),
+        'rss': (scrape_public_calendar_feeds, WATCH_INTERVALS['rss']),
+    }
+
+    polls_per_day = GOOGLE_DAILY_QUOTA // len(get_google_search_queries())
+    if polls_per_day:
+        google_interval = 24 * 60 * 60 / polls_per_day / (1 - WATCH_JITTER)
+        sources['google'] = (poll_google, google_interval)
+    else:
+        print(f"⚠️  Google quota ({GOOGLE_DAILY_QUOTA}/day) is too small for a full poll, not polling Google")
+
+    return sources
+
+
+def poll_google():
+    """Watch mode Google poll: only runs if today's budget covers every query"""
+    needed = len(get_google_search_queries())
+    left = GOOGLE_DAILY_QUOTA - load_google_budget()
+    if left < needed:
+        print(f"  ⏸️  Only {left} Google queries left today ({needed} needed), skipping poll")
+        return []
+    return scrape_google_events()
+
+
+def jittered(interval):
+    """Randomize an interval by +/- WATCH_JITTER so polls don't line up"""
+    return interval * random.uniform(1 - WATCH_JITTER, 1 + WATCH_JITTER)
+
+
+def flush_events(pending, all_events, shards_dir=None):
+    """
+    Write a batch of new events: cache images, append to index.html,
+    refresh the city payloads (if shards_dir is set) from the in-memory
+    event list
+    """
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    match = re.search(r'const MANUAL_EVENTS = \[(.*?)\];', html_content, re.DOTALL)
+    if not match:
+        print("❌ Could not find MANUAL_EVENTS array")
+        return
+
+    events = check_event_links(pending)
+    if not events:
+        return
+
+    events = process_event_images(events)
+    append_events_to_html(html_content, match, events)
+
+    all_events.extend(events)
+    if shards_dir:
+        write_city_shards(shards_dir, all_events)
+
+
+def watch(threshold=DUPLICATE_THRESHOLD, shards_dir=None):
+    """
+    Long-running mode: poll each source on its own schedule and write
+    new events in batches. Existing events and the dedup index are parsed
+    once and kept in memory, so a poll only costs its own requests.
+    Stops on Ctrl+C / SIGTERM after writing any pending events.
+    """
+    profiled('cleanup', cleanup_existing_duplicates)
+    profiled('images', localize_existing_images)
+
+    with open('index.html', 'r', encoding='utf-8') as f:
+        all_events = extract_existing_events(f.read())
+    dedup_index = build_dedup_index(all_events)
+    print(f"👀 Watching sources ({len(all_events)} events loaded)")
+
+    sources = get_watch_sources()
+    now = time.time()
+    # Spread the first polls over a minute instead of firing all at once
+    next_poll = {name: now + random.uniform(0, 60) for name in sources}
+    for name, (_, interval) in sources.items():
+        print(f"   {name}: every {interval / 60:.0f} min")
+
+    pending = []
+    last_flush = now
+    stopping = []
+
+    def request_stop(signum, frame):
+        stopping.append(signum)
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    while not stopping:
+        now = time.time()
+
+        for name, (scrape, interval) in sources.items():
+            if now < next_poll[name] or stopping:
+                continue
+
+            print(f"🔄 Polling {name}...")
+            try:
+                new_events = profiled(
+                    f'poll-{name}',
+                    lambda: filter_duplicates(scrape(), [], threshold=threshold, dedup_index=dedup_index)
+                )
+            except Exception as e:
+                print(f"  ❌ Error polling {name}: {e}")
+                new_events = []
+
+            # Index right away so later polls see these before they're flushed
+            add_to_dedup_index(dedup_index, new_events)
+            pending.extend(new_events)
+            if new_events:
+                print(f"  ✅ {len(new_events)} new events from {name} ({len(pending)} pending)")
+
+            next_poll[name] = time.time() + jittered(interval)
+
+        now = time.time()
+        if pending and (now - last_flush >= WATCH_FLUSH_INTERVAL or len(pending) >= WATCH_FLUSH_BATCH):
+            profiled('flush', flush_events, pending, all_events, shards_dir)
+            pending = []
+            last_flush = now
+
+        # Sleep until the next poll or flush is due (short naps keep stop responsive)
+        next_due = min(next_poll.values())
+        if pending:
+            next_due = min(next_due, last_flush + WATCH_FLUSH_INTERVAL)
+        time.sleep(max(0.0, min(next_due - time.time(), 5.0)))
+
+    if pending:
+        profiled('flush', flush_events, pending, all_events, shards_dir)
+    print("👋 Watch mode stopped")
+
+
+# =============================================================================
+# PROFILING
+# =============================================================================
+
+# Set by enable_profiling(); stays None when profiling is off.
+# 'workers' collects profiles of worker thread calls during a stage.
+PROFILING = {'dir': None, 'stats': None, 'workers': []}
+
+
+def enable_profiling(profile_dir):
+    """Turn on per-stage profiling, writing results to profile_dir"""
+    os.makedirs(profile_dir, exist_ok=True)
+    PROFILING['dir'] = profile_dir
+    PROFILING['stats'] = None
+    print(f"🔬 Profiling enabled - writing to {profile_dir}/")
+
+
+def sample_stacks(stop, counts):
+    """
+    Sampling profiler loop: every PROFILE_SAMPLE_INTERVAL seconds, record
+    the stack of every other thread as a collapsed 'thread;root;...;leaf' key
+    """
+    own_id = threading.get_ident()
+    while not stop.wait(PROFILE_SAMPLE_INTERVAL):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                stack.append(names.get(thread_id, f'thread-{thread_id}'))
+                key = ';'.join(reversed(stack))
+                counts[key] = counts.get(key, 0) + 1
+
+
+def profiled_worker(func):
+    """
+    Wrap a function run by a thread pool so each call is profiled too
+    (before Python 3.12, cProfile only sees the thread it runs in). The
+    calls are merged into the profile of the enclosing stage. From 3.12
+    the stage's profiler already sees every thread, and a second profiler
+    can't be started, so the function is returned unwrapped.
+    """
+    if not PROFILING['dir'] or sys.version_info >= (3, 12):
+        return func
+
+    def worker(*args, **kwargs):
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            PROFILING['workers'].append(profile)
+
+    return worker
+
+
+def print_hot_functions(stats, title):
+    """Print the PROFILE_TOP_N functions with the most time spent in them"""
+    print(f"🔥 {title} - top {PROFILE_TOP_N} by own time:")
+    print(f"   {'own s':>8} {'total s':>8} {'calls':>8}  function")
+
+    hot = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    for (filename, line, name), (_, calls, own, total, _) in hot[:PROFILE_TOP_N]:
+        location = f'{os.path.basename(filename)}:{line}' if line else filename
+        print(f"   {own:8.3f} {total:8.3f} {calls:8d}  {name} ({location})")
+
+
+def profiled(stage, func, *args, **kwargs):
+    """
+    Run one pipeline stage, under cProfile and a stack sampler if profiling
+    is enabled. Writes <stage>.pstats (for pstats/snakeviz) and
+    <stage>.collapsed (for flamegraph.pl/speedscope) to the profile dir.
+    Worker threads show up in both: the sampler sees every thread, and
+    calls wrapped with profiled_worker are added to the stage's profile.
+    """
+    if not PROFILING['dir']:
+        return func(*args, **kwargs)
+
+    counts = {}
+    stop = threading.Event()
+    sampler = threading.Thread(target=sample_stacks, args=(stop, counts), daemon=True)
+    profile = cProfile.Profile()
+    PROFILING['workers'] = []
+
+    sampler.start()
+    try:
+        return profile.runcall(func, *args, **kwargs)
+    finally:
+        stop.set()
+        sampler.join()
+
+        stats = pstats.Stats(profile)
+        for worker_profile in PROFILING['workers']:
+            stats.add(worker_profile)
+        PROFILING['workers'] = []
+
+        base = os.path.join(PROFILING['dir'], stage)
+        stats.dump_stats(f'{base}.pstats')
+        with open(f'{base}.collapsed', 'w', encoding='utf-8') as f:
+            for stack, count in sorted(counts.items()):
+                f.write(f'{stack} {count}\n')
+
+        print_hot_functions(stats, f'Stage {stage}')
+
+        # Keep a combined profile of all stages for the final summary
+        if PROFILING['stats'] is None:
+            PROFILING['stats'] = stats
+        else:
+            PROFILING['stats'].add(stats)
+
+
+def finish_profiling():
+    """Write the combined profile of all stages and print its hot functions"""
+    if not PROFILING['dir'] or PROFILING['stats'] is None:
+        return
+
+    PROFILING['stats'].dump_stats(os.path.join(PROFILING['dir'], 'all.pstats'))
+    print_hot_functions(PROFILING['stats'], 'All stages')
+
+
+# =============================================================================
+# DRY RUN
+# =============================================================================
+
+def plan_changes(checkpoint, threshold=DUPLICATE_THRESHOLD):
+    """
+    Run the whole pipeline without writing anything
+    Returns a change plan: events to add (minus those whose cached link
+    status is dead), existing duplicates to remove,
+    events the prune stage would remove (from cached link statuses),
+    past events (hidden by the site, but not removed), duplicates found
+    with similarity scores, and per-stage timings in seconds
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    match = re.search(r'const MANUAL_EVENTS = \[(.*?)\];', html_content, re.DOTALL)
+    event_objects = profiled('parse', parse_js_objects, match.group(1)) if match else []
+    existing_events = [parse_js_event(obj_str) for obj_str, _, _, _ in event_objects]
+    timings['parse'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, existing_duplicates = profiled('cleanup', find_existing_duplicates, event_objects)
+    timings['cleanup'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scraped = profiled('scrape', scrape_events, checkpoint)
+    timings['scrape'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    duplicates = []
+    to_add = profiled(
+        'dedup', filter_duplicates,
+        scraped, existing_events, threshold=threshold, report=duplicates
+    )
+    timings['dedup'] = time.perf_counter() - start
+
+    # New events with a dead link are dropped before they're written
+    start = time.perf_counter()
+    new_link_results = cached_link_results([event['url'] for event in to_add])
+    to_add = [event for event in to_add if not is_dead_link(new_link_results.get(event['url']))]
+    timings['links'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    urls = [event.get('url', '') for event in existing_events]
+    link_results = cached_link_results(urls)
+    dead = find_dead_links(urls, link_results)
+    timings['prune'] = time.perf_counter() - start
+
+    past = [event for event in existing_events if is_event_past(event.get('date', ''))]
+
+    return {
+        'threshold': threshold,
+        'inputs': checkpoint['date'],
+        'existing': len(existing_events),
+        'scraped': len(scraped),
+        'add': [
+            {'title': e['title'], 'source': e.get('source', ''), 'city': event_city(e) or '', 'date': e.get('date', '')}
+            for e in to_add
+        ],
+        'merge': existing_duplicates,
+        # None when pruning would be skipped because too many links look dead
+        'prune': None if dead is None else [
+            {'title': existing_events[i]['title'], 'url': urls[i], 'status': link_results[urls[i]]['status']}
+            for i in dead
+        ],
+        'past': [{'title': e['title'], 'date': e.get('date', '')} for e in past],
+        'duplicates': duplicates,
+        'timings': {stage: round(seconds, 4) for stage, seconds in timings.items()},
+    }
+
+
+def print_plan(plan):
+    """Print a human readable summary of a change plan"""
+    print("=" * 50)
+    print(f"📋 Change plan (threshold {plan['threshold']}, inputs from {plan['inputs']})")
+    print(f"   {plan['scraped']} scraped, {plan['existing']} existing events")
+
+    print(f"   ➕ Add: {len(plan['add'])}")
+    for event in plan['add']:
+        print(f"      {event['title'][:60]} [{event['source']}]")
+
+    print(f"   🔀 Merge (existing duplicates): {len(plan['merge'])}")
+    for title in plan['merge']:
+        print(f"      {title[:60]}")
+
+    if plan['prune'] is None:
+        print("   💀 Prune (dead links): skipped, too many links look dead")
+    else:
+        print(f"   💀 Prune (dead links, cached statuses): {len(plan['prune'])}")
+        for event in plan['prune']:
+            print(f"      {event['title'][:60]} ({event['status']})")
+
+    print(f"   ⌛ Past (hidden on the site, not removed): {len(plan['past'])}")
+    for event in plan['past']:
+        print(f"      {event['title'][:60]} ({event['date']})")
+
+    print(f"   🔄 Duplicates skipped: {len(plan['duplicates'])}")
+    for dup in plan['duplicates']:
+        print(f"      {dup['similarity']:.2f} {dup['title'][:40]} ↳ {dup['matched'][:40]}")
+
+    print("   ⏱️  " + ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in plan['timings'].items()))
+
+
+def parse_args():
+    """Command line options"""
+    parser = argparse.ArgumentParser(description='Scrape Kosovo events and update index.html')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='run the pipeline on cached inputs and print a change plan, writing nothing')
+    parser.add_argument('--plan-json', metavar='PATH',
+                        help='with --dry-run, also write the change plan as JSON to PATH (- for stdout)')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running, polling each source on its own schedule')
+    parser.add_argument('--profile', action='store_true',
+                        default=os.environ.get('SCRAPER_PROFILE', '') not in ('', '0'),
+                        help='profile each stage (also SCRAPER_PROFILE=1)')
+    parser.add_argument('--profile-dir', default=PROFILE_DIR,
+                        help=f'where to write profiles (default {PROFILE_DIR}, or SCRAPER_PROFILE_DIR)')
+    parser.add_argument('--city-shards', metavar='DIR', nargs='?', const=CITY_SHARDS_DIR,
+                        help=f'also write one JSON payload per city to DIR (default {CITY_SHARDS_DIR})')
+    parser.add_argument('--threshold', type=float, default=DUPLICATE_THRESHOLD,
+                        help=f'duplicate similarity threshold (default {DUPLICATE_THRESHOLD})')
+    return parser.parse_args()
 
 
 def main():
     """Main function"""
+    args = parse_args()
+
+    # With --plan-json -, stdout carries only the JSON plan; progress goes to stderr
+    plan_output = sys.stdout
+    if args.dry_run and args.plan_json == '-':
+        sys.stdout = sys.stderr
+
     print("🎉 Dola Event Scraper Started")
     print("=" * 50)
 
+    if args.profile:
+        enable_profiling(args.profile_dir)
+
+    if args.dry_run:
+        plan = plan_changes(load_checkpoint(cached_only=True), threshold=args.threshold)
+        print_plan(plan)
+
+        if args.plan_json == '-':
+            print(json.dumps(plan, ensure_ascii=False, indent=2), file=plan_output)
+        elif args.plan_json:
+            with open(args.plan_json, 'w', encoding='utf-8') as f:
+                json.dump(plan, f, ensure_ascii=False, indent=2)
+
+        finish_profiling()
+        return
+
+    if args.watch:
+        watch(threshold=args.threshold, shards_dir=args.city_shards)
+        finish_profiling()
+        return
+
+    # Resume a run that died part way through, if any
+    checkpoint = load_checkpoint()
+
     # First, clean up any existing duplicates
-    cleanup_existing_duplicates()
+    profiled('cleanup', cleanup_existing_duplicates)
+
+    # Drop events whose pages have disappeared
+    profiled('prune', prune_dead_events)
+
+    # Serve images of existing events and static cards locally
+    profiled('images', localize_existing_images)
 
     print("=" * 50)
 
     # Scrape new events
-    events = scrape_events()
+    events = profiled('scrape', scrape_events, checkpoint)
 
     # Update HTML file (with duplicate detection)
-    update_html_file(events)
+    profiled('update', update_html_file, events, threshold=args.threshold)
+
+    # Split the full event list into per-city payloads, if asked to
+    if args.city_shards:
+        profiled('shards', write_city_shards, args.city_shards)
+
+    # Everything is written - the next run starts fresh
+    clear_checkpoint()
 
     print("=" * 50)
+    finish_profiling()
     print("✨ Done!")
 
 